@@ -53,6 +53,40 @@ def get_exception(error):
     return message
 
 
+class BoardMatch:
+    """
+    Class for a board the Arduino CLI matched to a detected device
+
+    Uses __slots__ as an instance is created for every match on every device scan
+    """
+
+    __slots__ = ("name", "fqbn")
+
+    def __init__(self, name, fqbn):
+        self.name = name
+        self.fqbn = fqbn
+
+    def __repr__(self):
+        return f"BoardMatch(name={self.name!r}, fqbn={self.fqbn!r})"
+
+
+class DetectedDevice:
+    """
+    Class for a device detected by the Arduino CLI, with the port and list of BoardMatch instances
+
+    The first entry in matching_boards is the board in use for the device
+    """
+
+    __slots__ = ("port", "matching_boards")
+
+    def __init__(self, port, matching_boards):
+        self.port = port
+        self.matching_boards = matching_boards
+
+    def __repr__(self):
+        return f"DetectedDevice(port={self.port!r}, matching_boards={self.matching_boards!r})"
+
+
 class ThreadedArduinoCLI(Thread):
     """
     Class to run Arduino CLI commands in a separate thread, returning results to the provided queue
@@ -102,11 +136,14 @@ class ThreadedArduinoCLI(Thread):
         with self.arduino_cli_lock:
             try:
                 startupinfo = None
+                creationflags = 0
                 if platform.system() == "Windows":
                     startupinfo = subprocess.STARTUPINFO()
                     startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                    # Don't allocate a console for the CLI at all, avoids the setup cost and window flash
+                    creationflags = subprocess.CREATE_NO_WINDOW
                 self.process = subprocess.Popen(self.process_params, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                                startupinfo=startupinfo)
+                                                startupinfo=startupinfo, creationflags=creationflags)
                 self.output, self.error = self.process.communicate()
                 self.log.debug(self.process_params)
             except Exception as error:
@@ -127,7 +164,7 @@ class ThreadedArduinoCLI(Thread):
                 topic = ""
                 data = ""
                 if self.error:
-                    error = json.loads(self.error.decode())
+                    error = json.loads(self.error)
                     topic = "Error in compile or upload"
                     data = ""
                     if "error" in error:
@@ -144,7 +181,7 @@ class ThreadedArduinoCLI(Thread):
                         data = error
                 else:
                     if self.output:
-                        details = json.loads(self.output.decode())
+                        details = json.loads(self.output)
                         if "success" in details:
                             if details["success"] is True:
                                 topic = "Success"
@@ -167,7 +204,8 @@ class ThreadedArduinoCLI(Thread):
                 else:
                     status = "error"
                     self.log.error(data)
-                self.log.debug(f"Thread output, status: {status}\ntopic: {topic}\ndata: {data}\nparams: {self.params}")
+                self.log.debug("Thread output, status: %s\ntopic: %s\ndata: %s\nparams: %s",
+                               status, topic, data, self.params)
                 self.queue.put(
                     QueueMessage(status, topic, data)
                 )
@@ -307,6 +345,8 @@ class ArduinoCLI:
         Initialise the Arduino CLI instance
 
         The instance retains the current list of detected devices and the current selected device (if any)
+
+        Detected devices are DetectedDevice instances
         """
         self.selected_device = selected_device
         self.detected_devices = []
@@ -530,6 +570,9 @@ class ArduinoCLI:
     def list_boards(self, file_path, queue):
         """
         Returns a list of attached boards
+
+        The Arduino CLI only writes the JSON list once discovery has finished, so the whole list is returned
+        in a single queue message rather than as each board is found
         """
         params = ["board", "list", "--format", "jsonmini"]
         acli = ThreadedArduinoCLI(file_path, params, queue, 120)
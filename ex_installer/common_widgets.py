@@ -32,11 +32,33 @@ import platform
 import os
 import subprocess
 import webbrowser
+from functools import lru_cache, partial
 
 # Import local modules
 from . import images
 from .serial_monitor import SerialMonitor
-from .common_fonts import CommonFonts
+
+
+@lru_cache(maxsize=None)
+def load_image(image_file):
+    """
+    Function to open and decode an image file, returning a PIL image
+
+    Images are cached so each file is only read and decoded once for the application
+    """
+    image = Image.open(image_file)
+    image.load()
+    return image
+
+
+@lru_cache(maxsize=None)
+def get_ctk_image(image_file, size):
+    """
+    Function to get a CTkImage for an image file at the provided size, which must be a tuple (width, height)
+
+    CTkImages are cached so views created or recreated later share the same image instance
+    """
+    return ctk.CTkImage(light_image=load_image(image_file), size=size)
 
 
 class WindowLayout(ctk.CTkFrame):
@@ -57,8 +79,8 @@ class WindowLayout(ctk.CTkFrame):
         self.acli = parent.acli
         self.git = parent.git
 
-        # Set up fonts
-        self.common_fonts = CommonFonts(self)
+        # Use the fonts created once by the main application window
+        self.common_fonts = parent.common_fonts
 
         # Get application version
         self.app_version = parent.app_version
@@ -148,10 +170,9 @@ class WindowLayout(ctk.CTkFrame):
         """
         Function to update the title logo
 
-        Call and pass a logo as defined in the images module
+        Call and pass a logo as defined in the images module, the logo is only decoded once for all views
         """
-        self.title_logo = Image.open(logo)
-        self.title_image = ctk.CTkImage(light_image=self.title_logo, size=(200, 40))
+        self.title_image = get_ctk_image(logo, (200, 40))
         self.title_logo_label.configure(image=self.title_image)
 
     def set_title_text(self, text):
@@ -160,10 +181,36 @@ class WindowLayout(ctk.CTkFrame):
         """
         self.title_label.configure(text=text)
 
+    def configure_next_back(self, back_text=None, back_view=None, next_text=None, next_view=None,
+                            show_monitor=False):
+        """
+        Function to set up the next/back buttons to switch to the provided views in a single call
+
+        Buttons without text are hidden, and the monitor button is hidden unless show_monitor is True
+        """
+        if back_text is None:
+            self.next_back.hide_back()
+        else:
+            self.next_back.set_back_text(back_text)
+            if back_view is not None:
+                self.next_back.set_back_command(partial(self.parent.switch_view, back_view))
+        if next_text is None:
+            self.next_back.hide_next()
+        else:
+            self.next_back.set_next_text(next_text)
+            if next_view is not None:
+                self.next_back.set_next_command(partial(self.parent.switch_view, next_view))
+        if not show_monitor:
+            self.next_back.hide_monitor_button()
+
     def monitor_queue(self, queue, event):
         """
         Monitor the provided queue for status updates
+
+        Monitoring stops if the view has replaced its queue, so results from abandoned processes are ignored
         """
+        if queue is not self.queue:
+            return
         while not queue.empty():
             item = queue.get()
             if item.status == "success" or item.status == "error":
@@ -235,9 +282,13 @@ class WindowLayout(ctk.CTkFrame):
     def restore_input_states(self):
         """
         Restores the state of all widgets
+
+        Widgets destroyed while the process was running are skipped
         """
         for widget in self.widget_states:
-            widget["widget"].configure(state=widget["state"])
+            if widget["widget"].winfo_exists():
+                widget["widget"].configure(state=widget["state"])
+        self.widget_states.clear()
 
     @staticmethod
     def get_exception(error):
@@ -264,26 +315,28 @@ class NextBack(ctk.CTkFrame):
 
         self.grid_columnconfigure((0, 1, 2, 3, 4), weight=1)
 
-        # Set up fonts
-        self.common_fonts = CommonFonts(self)
+        # Use the main window's fonts
+        self.common_fonts = self.winfo_toplevel().common_fonts
 
         button_font = self.common_fonts.button_font
         button_options = {"width": 220, "height": 30, "font": button_font}
 
-        self.back_arrow = Image.open(images.BACK_ARROW)
-        self.back_arrow_image = ctk.CTkImage(light_image=self.back_arrow, size=(15, 15))
+        self.back_arrow_image = get_ctk_image(images.BACK_ARROW, (15, 15))
         self.back_button = ctk.CTkButton(self, image=self.back_arrow_image,
                                          text="Back", compound="left",
                                          anchor="w",
                                          **button_options)
 
-        self.next_arrow = Image.open(images.NEXT_ARROW)
-        self.next_arrow_image = ctk.CTkImage(light_image=self.next_arrow, size=(15, 15))
+        self.next_arrow_image = get_ctk_image(images.NEXT_ARROW, (15, 15))
         self.next_button = ctk.CTkButton(self, image=self.next_arrow_image,
                                          text="Next", compound="right",
                                          anchor="e",
                                          **button_options)
 
+        # Record the button text so it's only updated when it changes
+        self.back_text = "Back"
+        self.next_text = "Next"
+
         self.log_button = ctk.CTkButton(self, text="Show Log", width=100, height=30, font=button_font,
                                         command=self.show_log)
 
@@ -298,7 +351,9 @@ class NextBack(ctk.CTkFrame):
 
     def set_back_text(self, text):
         """Update back button text"""
-        self.back_button.configure(text=text)
+        if text != self.back_text:
+            self.back_button.configure(text=text)
+            self.back_text = text
 
     def disable_back(self):
         """Disable back button"""
@@ -321,7 +376,9 @@ class NextBack(ctk.CTkFrame):
 
     def set_next_text(self, text):
         """Update next button text"""
-        self.next_button.configure(text=text)
+        if text != self.next_text:
+            self.next_button.configure(text=text)
+            self.next_text = text
 
     def disable_next(self):
         """Disable next button"""
@@ -394,14 +451,13 @@ class FormattedTextbox(ctk.CTkTextbox):
     textbox = FormattedTextbox(master, arguments)
     textbox.insert_bullet("insert", "Bullet list item")
 
-    For a number of bullet list items:
+    For a number of bullet list items, insert them together:
     bullet_list = [
-    "Item 1",
-    "Item 2",
-    "Item 3
+    "Item 1\n",
+    "Item 2\n",
+    "Item 3\n"
     ]
-    for item in bullet_list:
-    -   textbox.insert_bullet("insert", item)
+    textbox.insert_bullets("insert", bullet_list)
     """
     def __init__(self, *args, **kwargs):
         """
@@ -411,8 +467,8 @@ class FormattedTextbox(ctk.CTkTextbox):
         """
         super().__init__(*args, **kwargs)
 
-        # Set up fonts
-        self.common_fonts = CommonFonts(self)
+        # Use the main window's fonts
+        self.common_fonts = self.winfo_toplevel().common_fonts
 
         default_font = self.common_fonts.instruction_font
         em = default_font.measure("m")
@@ -425,6 +481,12 @@ class FormattedTextbox(ctk.CTkTextbox):
         """
         self.insert(index, f"\u2022 {text}", "bullet")
 
+    def insert_bullets(self, index, text_list):
+        """
+        Function to insert a number of bullet points with a single insert
+        """
+        self.insert(index, "".join(f"\u2022 {text}" for text in text_list), "bullet")
+
 
 class CreateToolTip(object):
     """
@@ -453,8 +515,8 @@ class CreateToolTip(object):
         self.id = None
         self.tw = None
 
-        # Set up fonts
-        self.common_fonts = CommonFonts(self)
+        # Use the main window's fonts
+        self.common_fonts = self.widget.winfo_toplevel().common_fonts
 
     def enter_widget(self, event=None):
         """
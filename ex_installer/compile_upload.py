@@ -128,8 +128,8 @@ class CompileUpload(WindowLayout):
         self.congrats_label.grid_remove()
         self.success_label.grid_remove()
         text = (f"{pd[self.product]['product_name']} is now ready to be loaded on to your " +
-                f"{self.acli.detected_devices[self.acli.selected_device]['matching_boards'][0]['name']} " +
-                f"attached to {self.acli.detected_devices[self.acli.selected_device]['port']}")
+                f"{self.acli.detected_devices[self.acli.selected_device].matching_boards[0].name} " +
+                f"attached to {self.acli.detected_devices[self.acli.selected_device].port}")
         self.intro_label.configure(text=text)
         local_repo_dir = pd[self.product]["repo_name"].split("/")[1]
         self.install_dir = fm.get_install_dir(local_repo_dir)
@@ -154,9 +154,9 @@ class CompileUpload(WindowLayout):
         """
         Function to start the upload process via the Arduino CLI
         """
-        device = self.acli.detected_devices[self.acli.selected_device]["matching_boards"][0]["name"]
-        fqbn = self.acli.detected_devices[self.acli.selected_device]["matching_boards"][0]["fqbn"]
-        port = self.acli.detected_devices[self.acli.selected_device]["port"]
+        device = self.acli.detected_devices[self.acli.selected_device].matching_boards[0].name
+        fqbn = self.acli.detected_devices[self.acli.selected_device].matching_boards[0].fqbn
+        port = self.acli.detected_devices[self.acli.selected_device].port
         if event == "upload_software":
             self.set_details("")
             self.process_start("compiling",
@@ -210,7 +210,7 @@ class CompileUpload(WindowLayout):
         self.congrats_label.configure(text="Congratulations!")
         self.congrats_label.grid()
         text = (f"{pd[self.product]['product_name']} has successfully been loaded on to your " +
-                f"{self.acli.detected_devices[self.acli.selected_device]['matching_boards'][0]['name']}")
+                f"{self.acli.detected_devices[self.acli.selected_device].matching_boards[0].name}")
         self.success_label.configure(text=text)
         self.success_label.grid()
 
@@ -223,7 +223,7 @@ class CompileUpload(WindowLayout):
         self.congrats_label.configure(text="Error!")
         self.congrats_label.grid()
         text = (f"{pd[self.product]['product_name']} was not successfully loaded on to your " +
-                f"{self.acli.detected_devices[self.acli.selected_device]['matching_boards'][0]['name']}")
+                f"{self.acli.detected_devices[self.acli.selected_device].matching_boards[0].name}")
         self.success_label.configure(text=text)
         self.success_label.grid()
 
@@ -478,7 +478,7 @@ class EXCommandStation(WindowLayout):
         Disables EEPROM option for boards without it also
         """
         device = self.acli.selected_device
-        device_fqbn = self.acli.detected_devices[device]["matching_boards"][0]["fqbn"]
+        device_fqbn = self.acli.detected_devices[device].matching_boards[0].fqbn
         # EEPROM disabled on ESP32 and Nucleo
         if device_fqbn.startswith("esp32") or device_fqbn.startswith("STMicroelectronics:stm32"):
             self.disable_eeprom_switch.select()
@@ -762,17 +762,9 @@ class EXCommandStation(WindowLayout):
         Function to delete config files from product directory
           needed on subsequent passes thru the logic
         """
-        file_list = []
         local_repo_dir = pd[self.product]["repo_name"].split("/")[1]
         product_dir = fm.get_install_dir(local_repo_dir)
-        min_list = fm.get_config_files(product_dir, pd[self.product]["minimum_config_files"])
-        if min_list:
-            file_list += min_list
-        other_list = None
-        if "other_config_files" in pd[self.product]:
-            other_list = fm.get_config_files(product_dir, pd[self.product]["other_config_files"])
-        if other_list:
-            file_list += other_list
+        file_list = fm.get_config_files(product_dir, pd[self.product]["all_config_files"]) or []
         self.log.debug("Deleting files: %s", file_list)
         error_list = fm.delete_config_files(product_dir, file_list)
         if error_list:
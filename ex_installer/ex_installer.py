@@ -211,22 +211,17 @@ class EXInstaller(ctk.CTk):
 
         All default to None if not defined
         """
-        calling_product = None
         if view_class:
             if version:
                 version_details = GitClient.extract_version_details(version)
             if self.view:
                 if hasattr(self.view, "product"):
-                    calling_product = self.view.product
-                    self.log.debug("Calling product %s", calling_product)
+                    self.log.debug("Calling product %s", self.view.product)
                 self.log.debug("Switch from existing view %s", self.view._name)
             if view_class in self.frames:
                 self.log.debug("view_class=%s", view_class)
                 self.view = self.frames[view_class]
-                if (
-                    view_class == "compile_upload" or view_class == "advanced_config" or
-                    (view_class == "select_version_config" and product != calling_product)
-                ):
+                if view_class == "compile_upload" or view_class == "advanced_config":
                     self.view.destroy()
                     self.view = self.views[view_class](self)
                     self.frames[view_class] = self.view
@@ -237,6 +232,7 @@ class EXInstaller(ctk.CTk):
                     self.log.debug("Changing product for %s", view_class)
                     return
                 elif view_class == "select_version_config":
+                    # The existing view is reset by set_product if the product has changed
                     self.view.set_product(product)
                 if version and hasattr(self.view, "set_product_version"):
                     self.view.set_product_version(version, *version_details)
@@ -262,8 +258,8 @@ class EXInstaller(ctk.CTk):
         about_list = [f"EX-Installer version {self.app_version}"]
         if self.acli.selected_device is not None:
             index = self.acli.selected_device
-            board = self.acli.detected_devices[index]["matching_boards"][0]["name"]
-            port = self.acli.detected_devices[index]["port"]
+            board = self.acli.detected_devices[index].matching_boards[0].name
+            port = self.acli.detected_devices[index].port
             about_list.append(f"Current selected device: {board} on port {port}")
         about_message = "\n\n".join(about_list)
         about_box = CTkMessagebox(master=self, title="About EX-Installer", icon="info",
@@ -27,7 +27,6 @@ import platform
 import os
 import sys
 import tempfile
-import requests
 import tarfile
 from zipfile import ZipFile, Path
 from threading import Thread, Lock
@@ -60,6 +59,9 @@ class ThreadedDownloader(Thread):
             QueueMessage("info", f"Downloading {self.url}", f"Downloading {self.url}")
         )
         self.log.debug(self.url)
+        # Requests is only imported when something is downloaded, rather than at application start up
+        import requests
+
         with self.download_lock:
             _response = requests.get(self.url, stream=True)
             if _response.status_code == 200:
@@ -258,12 +260,19 @@ class FileManager:
         This is a valid example of a pattern: r"^my.*\.[^?]*example\.h$|(^my.*\.h$)"  # noqa: W605
         This is an invalid example of a pattern: r"^config\.h$"  # noqa: W605
         This would be valid, but better to just provide filename: r"^(config\.h)$"  # noqa: W605
+
+        Only files are matched, directories are skipped using the directory entries without further stat calls
+
+        Patterns are compiled once per call, results aren't cached as users can change files outside EX-Installer
         """
         if os.path.exists(dir):
             config_files = []
-            for file in os.listdir(dir):
-                for pattern in pattern_list:
-                    file_match = re.search(pattern, file)
+            patterns = [(pattern, re.compile(pattern)) for pattern in pattern_list]
+            with os.scandir(dir) as entries:
+                files = [entry.name for entry in entries if entry.is_file()]
+            for file in files:
+                for pattern, compiled_pattern in patterns:
+                    file_match = compiled_pattern.search(file)
                     if file_match and len(file_match.groups()) > 0:
                         filename = file_match[1]
                         if filename:
@@ -274,21 +283,48 @@ class FileManager:
         else:
             return False
 
+    @staticmethod
+    def find_missing_file(dir, file_list):
+        """
+        Function to find the first file in the provided list of file names that doesn't exist in the directory
+
+        Names are matched exactly against a single directory listing, the same as get_config_files(), so a file
+        is only found if it will also be copied, even on file systems that ignore case
+
+        Returns the missing file name, or None if all files exist
+        """
+        if os.path.isdir(dir):
+            with os.scandir(dir) as entries:
+                files = {entry.name for entry in entries if entry.is_file()}
+        else:
+            files = set()
+        return next((file for file in file_list if file not in files), None)
+
     @staticmethod
     def get_filepath(dir, filename):
         return os.path.join(dir, filename)
 
     @staticmethod
     def get_list_from_file(file_path, pattern):
+        """
+        Function to get a list of unique matches of group 1 of the provided pattern from each line of a file
+
+        The pattern is compiled once for the file, and duplicates are tracked in a set
+
+        Returns the list in the order found, or False if the file doesn't exist
+        """
         match_list = []
         if os.path.exists(file_path):
-            file = open(file_path, "r", encoding="utf-8")
-            for line in file:
-                match = re.search(pattern, line)
-                if match:
-                    option = match[1]
-                    if option not in match_list:
-                        match_list.append(option)
+            search = re.compile(pattern).search
+            found = set()
+            with open(file_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    match = search(line)
+                    if match:
+                        option = match[1]
+                        if option not in found:
+                            found.add(option)
+                            match_list.append(option)
             return match_list
         else:
             return False
@@ -330,22 +366,24 @@ class FileManager:
         """
         Check if directory is empty
 
+        Stops reading the directory at the first entry found
+
         Returns True if so, False if not
         """
-        if os.listdir(dir) > 0:
-            return False
-        else:
-            return True
+        with os.scandir(dir) as entries:
+            return next(entries, None) is None
 
     @staticmethod
     def copy_config_files(source_dir, dest_dir, file_list):
         """
         Copy the specified list of files from source to destination directory
 
+        Each file is only copied once even if listed more than once
+
         Returns None if successful, otherwise a list of files that failed to copy
         """
         failed_files = []
-        for file in file_list:
+        for file in dict.fromkeys(file_list):
             source = os.path.join(source_dir, file)
             dest = os.path.join(dest_dir, file)
             try:
@@ -362,13 +400,17 @@ class FileManager:
         """
         Delete the specified list of files from sepcified directory
 
-        Returns None if successful, otherwise a list of files that failed to copy
+        Each file is only removed once even if listed more than once, and files that no longer exist are ignored
+
+        Returns None if successful, otherwise a list of files that failed to delete
         """
         failed_files = []
-        for file_name in file_list:
+        for file_name in dict.fromkeys(file_list):
             file = os.path.join(dir, file_name)
             try:
                 os.remove(file)
+            except FileNotFoundError:
+                pass
             except Exception:
                 failed_files.append(file_name)
         if len(failed_files) > 0:
@@ -383,10 +425,7 @@ class FileManager:
 
         Returns True or False
         """
-        if os.path.exists(dir) and os.path.isdir(dir):
-            return True
-        else:
-            return False
+        return os.path.isdir(dir)
 
     @staticmethod
     def save_user_preferences(preferences):
@@ -400,7 +439,7 @@ class FileManager:
             try:
                 os.mkdir(user_dir)
             except Exception as dir_error:
-                FileManager.log.error(f"Could not create user preferences directory {user_dir}")
+                FileManager.log.error("Could not create user preferences directory %s", user_dir)
                 FileManager.log.error(dir_error)
         if isinstance(preferences, dict):
             user_file = os.path.join(FileManager.get_base_dir(), FileManager.user_preference_dir,
@@ -409,7 +448,7 @@ class FileManager:
                 with open(user_file, "w") as file_handle:
                     json.dump(preferences, file_handle)
             except Exception as file_error:
-                FileManager.log.error(f"Unable to write to user preferences file {user_file}")
+                FileManager.log.error("Unable to write to user preferences file %s", user_file)
                 FileManager.log.error(preferences)
                 FileManager.log.error(file_error)
 
@@ -428,6 +467,6 @@ class FileManager:
                 with open(user_file, "r") as file_handle:
                     preferences = json.load(file_handle)
             except Exception as file_error:
-                FileManager.log.error(f"Unable to read user preferences from file {user_file}")
+                FileManager.log.error("Unable to read user preferences from file %s", user_file)
                 FileManager.log.error(file_error)
         return preferences
@@ -42,6 +42,13 @@ gitignore_files = [
     ".DS_Store"
 ]
 
+"""
+Regular expression to match GitHub version style tags, compiled once for use when reading tags
+
+vX.Y.Z-Prod|Devel
+"""
+version_pattern = re.compile(r"v(\d+)\.(\d+)\.(\d+)-(Prod|Devel)")
+
 
 @staticmethod
 def get_exception(error):
@@ -168,16 +175,12 @@ class GitClient:
         """
         Check if directory exists and contains a .git file
 
+        A single check for .git is sufficient as it can't exist if the directory doesn't
+
         Returns True if so, False if not
         """
         git_file = os.path.join(dir, ".git")
-        if os.path.exists(dir) and os.path.isdir(dir):
-            if os.path.exists(git_file):
-                return True
-            else:
-                return False
-        else:
-            return False
+        return os.path.exists(git_file)
 
     @staticmethod
     def clone_repo(repo_url, repo_dir, queue):
@@ -237,6 +240,28 @@ class GitClient:
         thread = ThreadedGitClient(task_name, GitClient.pull, queue, repo, "origin", branch)
         thread.start()
 
+    @staticmethod
+    def checkout(repo, refname):
+        """
+        Function to checkout the provided ref in the provided repo
+
+        Expects a pygit2 repo object and either a ref name or reference object
+        """
+        GitClient.log.debug("Checkout %s", refname)
+        repo.checkout(refname=refname)
+        return True
+
+    @staticmethod
+    def checkout_ref(repo, refname, queue):
+        """
+        Checkout a ref in a repo using a separate thread
+
+        Threaded version of checkout
+        """
+        task_name = "checkout"
+        thread = ThreadedGitClient(task_name, GitClient.checkout, queue, repo, refname)
+        thread.start()
+
     @staticmethod
     def get_branch_ref(repo, name):
         """
@@ -256,23 +281,24 @@ class GitClient:
         """
         versions_unsorted = {}
         version_list = {}
-        version_match = r"v(\d+)\.(\d+)\.(\d+)-(Prod|Devel)"
+        # Iterate over tag references only, which are read directly by libgit2 rather than a git process
         refs = repo.references.iterator(2)
         for ref in refs:
-            version = re.search(version_match, ref.shorthand)
+            shorthand = ref.shorthand
+            version = version_pattern.search(shorthand)
             if version:
                 numbers = {"major": int(version[1]),
                            "minor": int(version[2]),
                            "patch": int(version[3]),
                            "type": version[4],
                            "ref": ref.name}
-                versions_unsorted[ref.shorthand] = numbers
-                version_list = OrderedDict(sorted(versions_unsorted.items(),
-                                           key=lambda t: (t[1]["major"],
-                                                          t[1]["minor"],
-                                                          t[1]["patch"]),
-                                           reverse=True))
-        if len(version_list.keys()) > 0:
+                versions_unsorted[shorthand] = numbers
+        if len(versions_unsorted) > 0:
+            version_list = OrderedDict(sorted(versions_unsorted.items(),
+                                       key=lambda t: (t[1]["major"],
+                                                      t[1]["minor"],
+                                                      t[1]["patch"]),
+                                       reverse=True))
             GitClient.log.debug("Tag list: %s", version_list)
         else:
             GitClient.log.error("No tags available for repository")
@@ -288,22 +314,25 @@ class GitClient:
         version_string must match a GitHub version style tag to work
         vX.Y.Z-Prod|Devel
         """
-        version_match = r"v(\d+)\.(\d+)\.(\d+)-(Prod|Devel)"
-        version = re.search(version_match, version_string)
+        version = version_pattern.search(version_string)
         if version:
             return (int(version[1]), int(version[2]), int(version[3]))
         else:
             return (None, None, None)
 
     @staticmethod
-    def get_latest_prod(repo, tag_name="Prod"):
+    def get_latest_prod(repo, tag_name="Prod", version_list=None):
         """
         Retrieves the latest Production tagged version from the repo
 
+        If the repo's versions have already been obtained with get_repo_versions, pass these in version_list to
+        avoid walking the repo's references again
+
         If no tags or no Prod tags, returns False
         """
         prod_version = None
-        version_list = GitClient.get_repo_versions(repo)
+        if version_list is None:
+            version_list = GitClient.get_repo_versions(repo)
         for version in version_list:
             if version_list[version]["type"] == "Prod":
                 prod_version = (version, version_list[version]["ref"])
@@ -312,14 +341,18 @@ class GitClient:
         return prod_version
 
     @staticmethod
-    def get_latest_devel(repo, tag_name="Devel"):
+    def get_latest_devel(repo, tag_name="Devel", version_list=None):
         """
         Retrieves the latest Development tagged version from the repo
 
+        If the repo's versions have already been obtained with get_repo_versions, pass these in version_list to
+        avoid walking the repo's references again
+
         If no tags or no Devel tags, returns False
         """
         devel_version = None
-        version_list = GitClient.get_repo_versions(repo)
+        if version_list is None:
+            version_list = GitClient.get_repo_versions(repo)
         for version in version_list:
             if version_list[version]["type"] == "Devel":
                 devel_version = (version, version_list[version]["ref"])
@@ -138,12 +138,8 @@ class ManageArduinoCLI(WindowLayout):
         self.set_title_text("Manage the Arduino CLI")
 
         # Set up next and back buttons
-        self.next_back.show_back()
-        self.next_back.set_back_text("Welcome")
-        self.next_back.set_back_command(lambda view="welcome": parent.switch_view(view))
-        self.next_back.set_next_text("Select your device")
-        self.next_back.set_next_command(lambda view="select_device": parent.switch_view(view))
-        self.next_back.hide_monitor_button()
+        self.configure_next_back(back_text="Welcome", back_view="welcome",
+                                 next_text="Select your device", next_view="select_device")
 
         # Create, grid, and configure container frame
         self.manage_cli_frame = ctk.CTkFrame(self.main_frame, height=360)
@@ -253,8 +249,8 @@ class ManageArduinoCLI(WindowLayout):
         """
         Check the version of the Arduino CLI, and if additional platforms are installed.
         """
-        self.log.debug(f"check_arduino_cli() called\nprocess_phase: {self.process_phase}\nprocess_status: " +
-                       f"{self.process_status}")
+        self.log.debug("check_arduino_cli() called\nprocess_phase: %s\nprocess_status: %s",
+                       self.process_phase, self.process_status)
         if self.process_status == "error":
             self._process_error()
         else:
@@ -280,7 +276,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_check_cli_version() {self.process_status}")
+        self.log.debug("_check_cli_version() %s", self.process_status)
         if self.process_status == "start":
             self.process_start("check_arduino_cli", "Checking Arduino CLI version", "Check_Arduino_CLI")
             self.acli.get_version(self.acli.cli_file_path(), self.queue)
@@ -314,7 +310,7 @@ class ManageArduinoCLI(WindowLayout):
 
         If unsuccessful, we must tell the users to close everything and try again, otherwise delete manually.
         """
-        self.log.debug(f"_delete_cli() {self.process_status}")
+        self.log.debug("_delete_cli() %s", self.process_status)
         if self.acli.delete_cli():
             self._generate_install_cli()
         else:
@@ -335,7 +331,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_get_installed_platforms() {self.process_status}")
+        self.log.debug("_get_installed_platforms() %s", self.process_status)
         if self.process_status == "start":
             self.process_start("get_platforms", "Obtaining list of installed platforms", "Check_Arduino_CLI")
             self.acli.get_platforms(self.acli.cli_file_path(), self.queue)
@@ -370,7 +366,7 @@ class ManageArduinoCLI(WindowLayout):
                         if installed_platform_id == platform_id and installed_version == version:
                             state = "installed"
                         elif installed_platform_id == platform_id and installed_version != version:
-                            self.log.debug(f"Incorrect version of {platform_id} installed: {installed_version}")
+                            self.log.debug("Incorrect version of %s installed: %s", platform_id, installed_version)
                             force_install = True
                     self.packages_to_install[platform_name]["state"] = state
                     # Iterate through the extra_platforms switches to set the state correctly
@@ -410,7 +406,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_get_installed_libraries() {self.process_status}")
+        self.log.debug("_get_installed_libraries() %s", self.process_status)
         if self.process_status == "start":
             self.process_start("get_libraries", "Obtaining list of installed libraries", "Check_Arduino_CLI")
             self.acli.get_libraries(self.acli.cli_file_path(), self.queue)
@@ -484,8 +480,8 @@ class ManageArduinoCLI(WindowLayout):
         - Install required libraries to the specified version
         - Refresh the list of attached boards
         """
-        self.log.debug(f"manage_cli() called\nprocess_phase: {self.process_phase}\nprocess_status: " +
-                       f"{self.process_status}")
+        self.log.debug("manage_cli() called\nprocess_phase: %s\nprocess_status: %s",
+                       self.process_phase, self.process_status)
         if self.process_status == "error":
             self._process_error()
         else:
@@ -531,7 +527,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_download_cli() {self.process_status}")
+        self.log.debug("_download_cli() %s", self.process_status)
         if self.process_status == "start":
             self.process_start("download_cli", "Downloading the Arduino CLI", "Manage_CLI")
             self.acli.download_cli(self.queue)
@@ -552,7 +548,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_extract_cli() {self.process_status}")
+        self.log.debug("_extract_cli() %s", self.process_status)
         if self.process_status == "start":
             download_file = self.process_data
             self.process_start("extract_cli", "Installing the Arduino CLI", "Manage_CLI")
@@ -576,7 +572,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_init_cli() {self.process_status}")
+        self.log.debug("_init_cli() %s", self.process_status)
         if self.process_status == "start":
             self.process_start("init_cli", "Configuring the Arduino CLI", "Manage_CLI")
             self.acli.initialise_config(self.acli.cli_file_path(), self.queue)
@@ -596,7 +592,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_update_core_index() {self.process_status}")
+        self.log.debug("_update_core_index() %s", self.process_status)
         if self.process_status == "start":
             self.process_start("update_index", "Updating core index", "Manage_CLI")
             self.acli.update_index(self.acli.cli_file_path(), self.queue)
@@ -629,7 +625,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_install_packages() {self.process_status}")
+        self.log.debug("_install_packages() %s", self.process_status)
         # Get the number of packages still to be installed
         install_count = self._get_package_install_count()
         # We only actually need to start if we have any to install, or if the previous was successful with more to go
@@ -659,7 +655,8 @@ class ManageArduinoCLI(WindowLayout):
         """
         package = platform_id + "@" + version
         self.packages_to_install[package_name]["state"] = "installed"
-        self.log.debug(f"_install_single_package() {self.process_status}\npackage_name: {package}, package: {package}")
+        self.log.debug("_install_single_package() %s\npackage_name: %s, package: %s",
+                       self.process_status, package_name, package)
         self.process_start("install_packages", f"Installing package {package_name}", "Manage_CLI")
         self.acli.install_package(self.acli.cli_file_path(), package, self.queue)
 
@@ -686,7 +683,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_install_libraries() {self.process_status}")
+        self.log.debug("_install_libraries() %s", self.process_status)
         # Get the number of libraries still to be installed
         install_count = self._get_library_install_count()
         # Only start if we have any to install, or if previous was successful and more to go
@@ -715,7 +712,7 @@ class ManageArduinoCLI(WindowLayout):
         """
         library = library_name + "@" + version
         self.libraries_to_install[library_name]["state"] = "installed"
-        self.log.debug(f"_install_single_library() {self.process_status}\nlibrary: {library}, version: {version}")
+        self.log.debug("_install_single_library() %s\nlibrary: %s, version: %s", self.process_status, library, version)
         self.process_start("install_libraries", "Install Arduino library " + library, "Manage_CLI")
         self.acli.install_library(self.acli.cli_file_path(), library, self.queue)
 
@@ -729,7 +726,7 @@ class ManageArduinoCLI(WindowLayout):
 
         Any other status is an error.
         """
-        self.log.debug(f"_refresh_boards() {self.process_status}")
+        self.log.debug("_refresh_boards() %s", self.process_status)
         if self.process_status == "start":
             self.process_start("refresh_boards", "Refreshing Arduino CLI board list", "Manage_CLI")
             self.acli.list_boards(self.acli.cli_file_path(), self.queue)
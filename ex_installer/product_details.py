@@ -30,21 +30,21 @@ product_details = {
         "repo_name": "DCC-EX/CommandStation-EX",
         "default_branch": "master",
         "repo_url": "https://github.com/DCC-EX/CommandStation-EX.git",
-        "supported_devices": [
+        "supported_devices": frozenset({
             "arduino:avr:uno",
             "arduino:avr:nano",
             "arduino:avr:mega",
             "esp32:esp32:esp32",
             "STMicroelectronics:stm32:Nucleo_64:pnum=NUCLEO_F411RE",
             "STMicroelectronics:stm32:Nucleo_64:pnum=NUCLEO_F446RE"
-        ],
-        "minimum_config_files": [
-            "config.h"
-        ],
-        "other_config_files": [
+        }),
+        "minimum_config_files": (
+            "config.h",
+        ),
+        "other_config_files": (
             r"^my.*\.[^?]*example\.cpp$|(^my.*\.cpp$)",
-            r"^my.*\.[^?]*example\.h$|(^my.*\.h$)"
-        ]
+            r"^my.*\.[^?]*example\.h$|(^my.*\.h$)",
+        )
     },
     "ex_ioexpander": {
         "product_name": "EX-IOExpander",
@@ -52,15 +52,15 @@ product_details = {
         "repo_name": "DCC-EX/EX-IOExpander",
         "default_branch": "main",
         "repo_url": "https://github.com/DCC-EX/EX-IOExpander.git",
-        "supported_devices": [
+        "supported_devices": frozenset({
             "arduino:avr:uno",
             "arduino:avr:nano",
             "arduino:avr:mega",
             "STMicroelectronics:stm32:Nucleo_64:pnum=NUCLEO_F411RE"
-        ],
-        "minimum_config_files": [
-            "myConfig.h"
-        ]
+        }),
+        "minimum_config_files": (
+            "myConfig.h",
+        )
     },
     "ex_turntable": {
         "product_name": "EX-Turntable",
@@ -68,12 +68,17 @@ product_details = {
         "repo_name": "DCC-EX/EX-Turntable",
         "default_branch": "main",
         "repo_url": "https://github.com/DCC-EX/EX-Turntable.git",
-        "supported_devices": [
+        "supported_devices": frozenset({
             "arduino:avr:uno",
             "arduino:avr:nano",
-        ],
-        "minimum_config_files": [
-            "config.h"
-        ]
+        }),
+        "minimum_config_files": (
+            "config.h",
+        )
     }
 }
+
+# Combine the minimum and other config files for each product, so all config files can be found in a single pass
+for details in product_details.values():
+    details["all_config_files"] = details["minimum_config_files"] + details.get("other_config_files", ())
+del details
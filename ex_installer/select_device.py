@@ -24,13 +24,42 @@ along with CommandStation.  If not, see <https://www.gnu.org/licenses/>.
 # Import Python modules
 import customtkinter as ctk
 import logging
-import serial.tools.list_ports
 import platform
+from functools import partial
+import time
+from threading import Thread, Lock
 
 # Import local modules
 from .common_widgets import WindowLayout, CreateToolTip
+from .arduino_cli import ArduinoCLI, BoardMatch, DetectedDevice
 from . import images
 
+"""
+Serial port descriptions from pyserial, used to describe devices the Arduino CLI doesn't identify
+
+Descriptions are keyed by port and are read again for each scan so they describe what is currently connected
+"""
+port_descriptions = {}
+port_description_lock = Lock()
+
+
+def refresh_port_descriptions():
+    """
+    Function to read USB/serial port descriptions using pyserial into port_descriptions
+
+    This is safe to run in a separate thread
+
+    The pyserial port tools are only imported when descriptions are actually needed
+    """
+    with port_description_lock:
+        import serial.tools.list_ports
+
+        port_descriptions.clear()
+        port_descriptions.update({
+            port.device: f" {port.product} ({port.device})" if port.product is not None else port.description
+            for port in serial.tools.list_ports.comports()
+        })
+
 
 class SelectDevice(WindowLayout):
     """
@@ -44,6 +73,25 @@ class SelectDevice(WindowLayout):
                         "If you have a generic or clone device, it likely appears as “Unknown”. In this instance, " +
                         "you will need to select the appropriate device from the pulldown list provided.")
 
+    # Define text to use in device tooltips
+    multi_device_tip = ("The Arduino CLI has recognised that there are multiple options that match " +
+                        "the device you have plugged in. Please select the correct device from the list " +
+                        "provided.")
+    unknown_device_tip = ("The Arduino CLI has detected a device but is unable to determine the correct type. " +
+                          "This commonly occurs with clone devices using generic USB to serial converters, but " +
+                          "will also occur with ESP32 and STM32 Nucleo devices as they do not use genuine " +
+                          "Arduino device drivers. We have displayed as much information as possible from the " +
+                          "operating system to help you select the correct port your device is attached to.")
+
+    # Minimum time in seconds between device scans, clicks within this time are ignored
+    scan_interval = 0.5
+
+    # Supported device names to offer for unknown devices, these are fixed so are only built once
+    supported_boards = tuple(ArduinoCLI.supported_devices)
+
+    # Board names that mean the correct device hasn't been selected yet
+    unselected_boards = frozenset({"Unknown", "Select the correct device"})
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
@@ -63,16 +111,28 @@ class SelectDevice(WindowLayout):
         # Start with an empty device list
         self.acli.detected_devices = []
 
+        # Time of the last device scan to ignore repeated clicks of the scan button
+        self.last_scan_time = 0.0
+
+        # Current state of the device list layout, only changed in set_state() when devices are found or lost
+        self.device_list_state = None
+
+        # Ports and matched FQBNs from the last scan, used to skip rebuilding the list if nothing has changed
+        self.device_signature = None
+
+        # Set when a board is chosen from a device's pulldown, the next scan then always rebuilds the list
+        self.board_manually_selected = False
+
+        # Thread reading serial port descriptions in the background during a scan
+        self.port_description_thread = None
+
         # Set up title
         self.set_title_logo(images.EX_INSTALLER_LOGO)
         self.set_title_text("Select your device")
 
         # Set up next/back buttons
-        self.next_back.set_back_text("Manage Arduino CLI")
-        self.next_back.set_back_command(lambda view="manage_arduino_cli": parent.switch_view(view))
-        self.next_back.set_next_text("Select product to install")
-        self.next_back.set_next_command(lambda view="select_product": parent.switch_view(view))
-        self.next_back.hide_monitor_button()
+        self.configure_next_back(back_text="Manage Arduino CLI", back_view="manage_arduino_cli",
+                                 next_text="Select product to install", next_view="select_product")
 
         # Set up and configure container frame
         self.select_device_frame = ctk.CTkFrame(self.main_frame, height=360)
@@ -92,20 +152,25 @@ class SelectDevice(WindowLayout):
                                                 command=lambda event="list_devices": self.list_devices(event))
 
         # Create device list container frame and variable
-        self.device_list_frame = ctk.CTkFrame(self.select_device_frame,
-                                              border_width=2,
-                                              fg_color="#E5E5E5")
+        # This scrolls so that many devices connected via a hub don't push the buttons off the page
+        self.device_list_frame = ctk.CTkScrollableFrame(self.select_device_frame,
+                                                        width=700, height=150,
+                                                        border_width=2,
+                                                        fg_color="#E5E5E5")
         self.device_list_frame.grid_columnconfigure((0, 1), weight=1)
         self.device_list_frame.grid_rowconfigure(0, weight=1)
         self.selected_device = ctk.IntVar(self, value=-1)
 
         # Create detected device label and grid
-        grid_options = {"padx": 5, "pady": 5}
         self.no_device_label = ctk.CTkLabel(self.select_device_frame, text="Scanning for devices",
                                             font=self.bold_instruction_font)
         self.device_list_label = ctk.CTkLabel(self.device_list_frame, text="Select your device",
                                               font=self.instruction_font)
-        self.device_list_label.grid(column=0, row=0, columnspan=2, **grid_options)
+        self.device_list_label.grid(column=0, row=0, columnspan=2, padx=5, pady=5)
+
+        # Rows for detected devices are in their own frame so they can be cleared with a single destroy
+        self.device_rows_frame = None
+        self.create_device_rows_frame()
 
         # Tooltips
         no_device_tip = ("The Arduino CLI was unable to detect any valid devices connected to your computer. " +
@@ -125,15 +190,18 @@ class SelectDevice(WindowLayout):
 
     def set_state(self):
         self.next_back.hide_log_button()
-        if len(self.acli.detected_devices) == 0:
-            self.list_device_button.configure(text="Scan for Devices")
-            self.no_device_label.grid()
-            self.device_list_frame.grid_remove()
-            self.log.debug("No devices detected")
-        else:
-            self.list_device_button.configure(text="Refresh Device List")
-            self.no_device_label.grid_remove()
-            self.device_list_frame.grid()
+        list_state = "populated" if self.acli.detected_devices else "empty"
+        if list_state != self.device_list_state:
+            if list_state == "empty":
+                self.list_device_button.configure(text="Scan for Devices")
+                self.no_device_label.grid()
+                self.device_list_frame.grid_remove()
+                self.log.debug("No devices detected")
+            else:
+                self.list_device_button.configure(text="Refresh Device List")
+                self.no_device_label.grid_remove()
+                self.device_list_frame.grid()
+            self.device_list_state = list_state
         if not self.acli.selected_device:
             self.next_back.disable_next()
         else:
@@ -143,20 +211,16 @@ class SelectDevice(WindowLayout):
         """
         Use the Arduino CLI to list attached devices
         """
-        multi_device_tip = ("The Arduino CLI has recognised that there are multiple options that match " +
-                            "the device you have plugged in. Please select the correct device from the list " +
-                            "provided.")
-        unknown_device_tip = ("The Arduino CLI has detected a device but is unable to determine the correct type. " +
-                              "This commonly occurs with clone devices using generic USB to serial converters, but " +
-                              "will also occur with ESP32 and STM32 Nucleo devices as they do not use genuine " +
-                              "Arduino device drivers. We have displayed as much information as possible from the " +
-                              "operating system to help you select the correct port your device is attached to.")
         if event == "list_devices":
+            now = time.monotonic()
+            if now - self.last_scan_time < self.scan_interval:
+                self.log.debug("Ignoring repeated scan request")
+                return
+            self.last_scan_time = now
             self.log.debug("List devices button clicked")
-            self.acli.detected_devices.clear()
-            self.acli.selected_device = None
-            for widget in self.device_list_frame.winfo_children():
-                widget.destroy()
+            # Read port descriptions while the Arduino CLI scans so they're ready for any unknown devices
+            self.port_description_thread = Thread(target=refresh_port_descriptions, daemon=True)
+            self.port_description_thread.start()
             self.process_start("refresh_list", "Scanning for attached devices", "List_Devices")
             self.acli.list_boards(self.acli.cli_file_path(), self.queue)
         elif self.process_phase == "refresh_list":
@@ -174,82 +238,110 @@ class SelectDevice(WindowLayout):
                     fake_data = [{'port': {'address': fake_port, 'label': fake_port, 'protocol': 'serial',
                                   'protocol_label': 'Serial Port (USB)'}}]
                     self.process_data = fake_data
+                # If the same devices are attached as the last scan, keep the current list and selection
+                # This only applies when the CLI identified every device and no board was chosen manually, as an
+                # unknown or clone device can't be told apart from a different one on the same port
+                if isinstance(self.process_data, list):
+                    device_signature = tuple(
+                        (board["port"]["address"],
+                         tuple(match["fqbn"] for match in board.get("matching_boards", ())))
+                        for board in self.process_data
+                    )
+                    all_identified = all(board.get("matching_boards") for board in self.process_data)
+                else:
+                    device_signature = ()
+                    all_identified = True
+                if all_identified and not self.board_manually_selected and device_signature == self.device_signature:
+                    self.log.debug("Attached devices unchanged")
+                    self.set_state()
+                    self.process_stop()
+                    return
+                self.clear_device_list()
+                self.device_signature = device_signature
                 if isinstance(self.process_data, list) and len(self.process_data) > 0:
-                    supported_boards = []
-                    for board in self.acli.supported_devices:
-                        supported_boards.append(board)
-                    grid_options = {"padx": 5, "pady": 5}
-                    for board in self.process_data:
-                        matching_board_list = []
-                        port = board["port"]["address"]
-                        self.log.debug("Device on %s found: %s", port, board)
-                        if "matching_boards" in board:
-                            for match in board["matching_boards"]:
-                                name = match["name"]
-                                fqbn = match["fqbn"]
-                                matching_board_list.append({"name": name, "fqbn": fqbn})
-                            self.log.debug("Matches: %s", matching_board_list)
-                        else:
-                            matching_board_list.append({"name": "Unknown", "fqbn": "unknown"})
-                            self.log.debug("Device unknown")
-                        self.acli.detected_devices.append({"port": port, "matching_boards": matching_board_list})
-                        self.log.debug("Found device list")
-                        self.log.debug(self.acli.detected_devices)
+                    # Devices without matching boards are unknown or clones
+                    self.acli.detected_devices = [
+                        DetectedDevice(board["port"]["address"],
+                                       [BoardMatch(match["name"], match["fqbn"])
+                                        for match in board.get("matching_boards", ())] or
+                                       [BoardMatch("Unknown", "unknown")])
+                        for board in self.process_data
+                    ]
+                    self.log.debug("Found device list: %s", self.acli.detected_devices)
+                    self.device_rows_frame.grid_rowconfigure(tuple(range(len(self.acli.detected_devices))), weight=1)
                     for index, item in enumerate(self.acli.detected_devices):
-                        text = None
                         tip = None
-                        row = index + 1
-                        self.device_list_frame.grid_rowconfigure(row, weight=1)
+                        port = item.port
+                        matching_boards = item.matching_boards
+                        first_match = matching_boards[0]
                         self.log.debug("Process %s at index %s", item, index)
-                        if len(self.acli.detected_devices[index]["matching_boards"]) > 1:
-                            matched_boards = []
-                            for matched_board in self.acli.detected_devices[index]["matching_boards"]:
-                                matched_boards.append(matched_board["name"])
-                            multi_combo = ctk.CTkComboBox(self.device_list_frame,
+                        if len(matching_boards) > 1:
+                            matched_boards = [matched_board.name for matched_board in matching_boards]
+                            multi_combo = ctk.CTkComboBox(self.device_rows_frame,
                                                           values="Select the correct device", width=250,
-                                                          command=lambda name, i=index: self.update_board(name, i))
-                            multi_combo.grid(column=1, row=row, sticky="e", **grid_options)
+                                                          command=partial(self.update_board, index=index))
+                            multi_combo.grid(column=1, row=index, sticky="e", padx=5, pady=5)
                             multi_combo.configure(values=matched_boards)
-                            text = "Multiple matches detected"
-                            text += " on " + self.acli.detected_devices[index]["port"]
-                            tip = multi_device_tip
-                            self.log.debug("Multiple matched devices on %s", self.acli.detected_devices[index]["port"])
-                            self.log.debug(self.acli.detected_devices[index]["matching_boards"])
-                        elif self.acli.detected_devices[index]["matching_boards"][0]["name"] == "Unknown":
-                            unknown_combo = ctk.CTkComboBox(self.device_list_frame,
+                            text = "Multiple matches detected on " + port
+                            tip = self.multi_device_tip
+                            self.log.debug("Multiple matched devices on %s", port)
+                            self.log.debug("Matching boards on %s: %s", port, matching_boards)
+                        elif first_match.name == "Unknown":
+                            unknown_combo = ctk.CTkComboBox(self.device_rows_frame,
                                                             values=["Select the correct device"], width=250,
-                                                            command=lambda name, i=index: self.update_board(name, i))
-                            unknown_combo.grid(column=1, row=row, sticky="e", **grid_options)
-                            unknown_combo.configure(values=supported_boards)
-                            port_description = self.get_port_description(self.acli.detected_devices[index]["port"])
+                                                            command=partial(self.update_board, index=index))
+                            unknown_combo.grid(column=1, row=index, sticky="e", padx=5, pady=5)
+                            unknown_combo.configure(values=self.supported_boards)
+                            port_description = self.get_port_description(port)
                             if port_description:
                                 text = f"Unknown/clone detected as {port_description}"
                             else:
-                                text = ("Unknown or clone device detected on " +
-                                        self.acli.detected_devices[index]['port'])
-                            tip = unknown_device_tip
-                            self.log.debug("Unknown or clone device on %s", self.acli.detected_devices[index]["port"])
+                                text = "Unknown or clone device detected on " + port
+                            tip = self.unknown_device_tip
+                            self.log.debug("Unknown or clone device on %s", port)
                         else:
-                            text = self.acli.detected_devices[index]["matching_boards"][0]["name"]
-                            text += " on " + self.acli.detected_devices[index]["port"]
-                            self.log.debug("%s on %s", self.acli.detected_devices[index]["matching_boards"][0]["name"],
-                                           self.acli.detected_devices[index]["port"])
+                            text = first_match.name + " on " + port
+                            self.log.debug("%s on %s", first_match.name, port)
                             self.select_device()
-                        radio_button = ctk.CTkRadioButton(self.device_list_frame, text=text,
+                        radio_button = ctk.CTkRadioButton(self.device_rows_frame, text=text,
                                                           variable=self.selected_device, value=index,
                                                           command=self.select_device)
                         if tip is not None:
                             CreateToolTip(radio_button, tip)
-                        radio_button.grid(column=0, row=row, sticky="w", **grid_options)
+                        radio_button.grid(column=0, row=index, sticky="w", padx=5, pady=5)
                 else:
                     self.no_device_label.configure(text="No devices found")
                 self.set_state()
                 self.process_stop()
             elif self.process_status == "error":
+                self.clear_device_list()
                 self.process_error(self.process_topic)
 
+    def clear_device_list(self):
+        """
+        Clear the detected devices, current selection, and device list widgets
+        """
+        self.acli.detected_devices = []
+        self.acli.selected_device = None
+        self.device_signature = None
+        self.board_manually_selected = False
+        self.create_device_rows_frame()
+
+    def create_device_rows_frame(self):
+        """
+        Create an empty frame for the detected device rows, replacing and destroying any existing one
+
+        Destroying the frame removes every row widget in one call rather than destroying each one
+        """
+        if self.device_rows_frame is not None:
+            self.device_rows_frame.destroy()
+        self.device_rows_frame = ctk.CTkFrame(self.device_list_frame, fg_color="transparent")
+        self.device_rows_frame.grid_columnconfigure((0, 1), weight=1)
+        self.device_rows_frame.grid(column=0, row=1, columnspan=2, sticky="nsew")
+
     def update_board(self, name, index):
         if name != "Select the correct device":
+            self.board_manually_selected = True
             if name.startswith("DCC-EX"):
                 if name in self.acli.dccex_devices:
                     self.acli.dccex_device = self.acli.dccex_devices[name]
@@ -257,23 +349,29 @@ class SelectDevice(WindowLayout):
                     self.acli.dccex_device = None
             else:
                 self.acli.dccex_device = None
-            self.acli.detected_devices[index]["matching_boards"][0]["name"] = name
-            self.acli.detected_devices[index]["matching_boards"][0]["fqbn"] = self.acli.supported_devices[name]
+            # A board the CLI matched already has its FQBN, so just move it first, otherwise it must be from
+            # the supported device list
+            matching_boards = self.acli.detected_devices[index].matching_boards
+            for position, match in enumerate(matching_boards):
+                if match.name == name:
+                    matching_boards.insert(0, matching_boards.pop(position))
+                    break
+            else:
+                first_match = matching_boards[0]
+                first_match.name = name
+                first_match.fqbn = self.acli.supported_devices[name]
             self.selected_device.set(index)
             self.select_device()
 
     def select_device(self):
         self.acli.selected_device = None
         device = self.selected_device.get()
-        if (
-            self.acli.detected_devices[device]["matching_boards"][0]["name"] != "Unknown" and
-            self.acli.detected_devices[device]["matching_boards"][0]["name"] != "Select the correct device"
-        ):
+        detected_device = self.acli.detected_devices[device]
+        name = detected_device.matching_boards[0].name
+        if name not in self.unselected_boards:
             self.acli.selected_device = device
             self.next_back.enable_next()
-            self.log.debug("Selected %s on port %s",
-                           self.acli.detected_devices[self.acli.selected_device]["matching_boards"][0]["name"],
-                           self.acli.detected_devices[self.acli.selected_device]["port"])
+            self.log.debug("Selected %s on port %s", name, detected_device.port)
             self.next_back.show_monitor_button()
         else:
             self.next_back.disable_next()
@@ -282,15 +380,13 @@ class SelectDevice(WindowLayout):
     def get_port_description(self, unknown_port):
         """
         Function to obtain USB/serial port descriptions using pyserial for ports the CLI doesn't identify
+
+        Descriptions are read in the background when a scan starts, if the port isn't in those results the
+        descriptions are read again in case the device was only just connected
         """
-        description = False
-        port_list = serial.tools.list_ports.comports()
-        if isinstance(port_list, list):
-            for port in port_list:
-                if port.device == unknown_port:
-                    if port.product is not None:
-                        description = f" {port.product} ({port.device})"
-                    else:
-                        description = port.description
-                    break
-        return description
+        if self.port_description_thread is not None:
+            self.port_description_thread.join()
+            self.port_description_thread = None
+        if unknown_port not in port_descriptions:
+            refresh_port_descriptions()
+        return port_descriptions.get(unknown_port, False)
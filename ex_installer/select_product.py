@@ -23,11 +23,11 @@ along with CommandStation.  If not, see <https://www.gnu.org/licenses/>.
 
 # Import Python modules
 import customtkinter as ctk
-from PIL import Image
 import logging
+from functools import partial
 
 # Import local modules
-from .common_widgets import WindowLayout
+from .common_widgets import WindowLayout, get_ctk_image
 from . import images
 from .product_details import product_details as pd
 
@@ -36,6 +36,15 @@ class SelectProduct(WindowLayout):
     """
     Class for the Select Product view
     """
+
+    # Products to offer with the logo size, button width, and layout for each product button
+    # EX-DCCInspector and EX-FastClock are not offered for the moment as it's misleading that they're "coming soon"
+    products = (
+        ("ex_commandstation", (300, 60), 500, {"column": 0, "row": 1, "columnspan": 2}),
+        ("ex_ioexpander", (200, 40), 140, {"column": 0, "row": 2, "sticky": "ew"}),
+        ("ex_turntable", (200, 40), 140, {"column": 1, "row": 2, "sticky": "ew"})
+    )
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
@@ -51,10 +60,7 @@ class SelectProduct(WindowLayout):
         self.set_title_text("Select the Product to install")
 
         # Set next/back buttons
-        self.next_back.set_back_text("Select Device")
-        self.next_back.set_back_command(lambda view="select_device": parent.switch_view(view))
-        self.next_back.hide_next()
-        self.next_back.hide_monitor_button()
+        self.configure_next_back(back_text="Select Device", back_view="select_device")
 
         # Set up and configure the container frame
         self.select_product_frame = ctk.CTkFrame(self.main_frame, height=360)
@@ -68,62 +74,22 @@ class SelectProduct(WindowLayout):
                                               text="Click the logo to choose the product to install",
                                               font=self.instruction_font)
 
-        # Create product logos
-        self.ex_commandstation_logo = Image.open(images.EX_COMMANDSTATION_LOGO)
-        self.ex_ioexpander_logo = Image.open(images.EX_IOEXPANDER_LOGO)
-        self.ex_turntable_logo = Image.open(images.EX_TURNTABLE_LOGO)
-        self.ex_dccinspector_logo = Image.open(images.EX_DCCINSPECTOR_LOGO)
-        self.ex_fastclock_logo = Image.open(images.EX_FASTCLOCK_LOGO)
-
-        # Create product images
-        image_size = [200, 40]
-        self.ex_commandstation_image = ctk.CTkImage(light_image=self.ex_commandstation_logo, size=(300, 60))
-        self.ex_ioexpander_image = ctk.CTkImage(light_image=self.ex_ioexpander_logo, size=image_size)
-        self.ex_turntable_image = ctk.CTkImage(light_image=self.ex_turntable_logo, size=image_size)
-        self.ex_dccinspector_image = ctk.CTkImage(light_image=self.ex_dccinspector_logo, size=image_size)
-        self.ex_fastclock_image = ctk.CTkImage(light_image=self.ex_fastclock_logo, size=image_size)
-
-        # Create product buttons
+        # Create and layout product buttons, images are cached so are only loaded once
         button_options = {"fg_color": "white",
                           "border_color": "#00A3B9",
                           "border_width": 2,
                           "compound": "top",
                           "text_color": "#00353D",
                           "height": 80}
-        self.ex_commandstation_button = ctk.CTkButton(self.select_product_frame,
-                                                      text=None, width=500,
-                                                      image=self.ex_commandstation_image, **button_options,
-                                                      command=lambda product="ex_commandstation":
-                                                      self.check_product_device(product))
-        self.ex_ioexpander_button = ctk.CTkButton(self.select_product_frame,
-                                                  text=None,
-                                                  image=self.ex_ioexpander_image, **button_options,
-                                                  command=lambda product="ex_ioexpander":
-                                                  self.check_product_device(product))
-        self.ex_turntable_button = ctk.CTkButton(self.select_product_frame,
-                                                 text=None,
-                                                 image=self.ex_turntable_image, **button_options,
-                                                 command=lambda product="ex_turntable":
-                                                 self.check_product_device(product))
-        self.ex_dccinspector_button = ctk.CTkButton(self.select_product_frame,
-                                                    text="(coming soon)",
-                                                    image=self.ex_dccinspector_image, **button_options,
-                                                    state="disabled")
-        self.ex_fastclock_button = ctk.CTkButton(self.select_product_frame,
-                                                 text="(coming soon)",
-                                                 image=self.ex_fastclock_image, **button_options,
-                                                 state="disabled")
-
-        # Layout product buttons
-        grid_options = {"sticky": "ew", "padx": 10, "pady": 10}
+        self.product_images = {}
+        self.product_buttons = {}
         self.instruction_label.grid(column=0, row=0, columnspan=2, padx=5, pady=5)
-        self.ex_commandstation_button.grid(column=0, row=1, columnspan=2, padx=10, pady=10)
-        self.ex_ioexpander_button.grid(column=0, row=2, **grid_options)
-        self.ex_turntable_button.grid(column=1, row=2, **grid_options)
-
-        # Disable these for the moment as it's misleading that they're "coming soon"
-        # self.ex_dccinspector_button.grid(column=0, row=3, **grid_options)
-        # self.ex_fastclock_button.grid(column=1, row=3, **grid_options)
+        for product, image_size, width, grid_options in self.products:
+            self.product_images[product] = get_ctk_image(pd[product]["product_logo"], image_size)
+            self.product_buttons[product] = ctk.CTkButton(self.select_product_frame, text=None, width=width,
+                                                          image=self.product_images[product], **button_options,
+                                                          command=partial(self.check_product_device, product))
+            self.product_buttons[product].grid(padx=10, pady=10, **grid_options)
 
         # Hide log button to start
         self.next_back.hide_log_button()
@@ -132,10 +98,12 @@ class SelectProduct(WindowLayout):
         """
         Method to validate the selected device is compatible with the selected product.
         """
-        device_fqbn = self.acli.detected_devices[self.acli.selected_device]["matching_boards"][0]["fqbn"]
-        device_name = self.acli.detected_devices[self.acli.selected_device]["matching_boards"][0]["name"]
-        product_name = pd[product]["product_name"]
-        if device_fqbn not in pd[product]["supported_devices"]:
+        selected_board = self.acli.detected_devices[self.acli.selected_device].matching_boards[0]
+        device_fqbn = selected_board.fqbn
+        device_name = selected_board.name
+        product_details = pd[product]
+        product_name = product_details["product_name"]
+        if device_fqbn not in product_details["supported_devices"]:
             self.process_error(f"Device type {device_name} is not supported for use with {product_name}\n" +
                                "Return to the Select Device screen and select a supported device")
             self.log.error("Device type %s is not supported for %s", device_name, product_name)
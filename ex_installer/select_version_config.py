@@ -27,6 +27,7 @@ along with CommandStation.  If not, see <https://www.gnu.org/licenses/>.
 import customtkinter as ctk
 import os
 import logging
+from queue import Queue
 from CTkMessagebox import CTkMessagebox
 
 # Import local modules
@@ -66,6 +67,7 @@ class SelectVersionConfig(WindowLayout):
 
         # Define variables
         self.product = None
+        self.product_details = None
         self.install_dir = None
         self.branch_name = None
         self.repo = None
@@ -73,6 +75,7 @@ class SelectVersionConfig(WindowLayout):
         self.latest_prod = None
         self.latest_devel = None
         self.product_dir = None
+        self.selected_ref = None
 
         # Set up next/back buttons
         self.next_back.set_back_text("Select Product")
@@ -93,13 +96,18 @@ class SelectVersionConfig(WindowLayout):
     def set_product(self, product):
         """
         Function to set the product details to manage the repository
+
+        If the view has been used for a different product, it is reset rather than being created again
         """
+        if self.product is not None and product != self.product:
+            self.reset_version_frame()
         self.product = product
-        self.set_title_text(f"Select {pd[self.product]['product_name']} version")
-        self.set_title_logo(pd[product]["product_logo"])
-        local_repo_dir = pd[self.product]["repo_name"].split("/")[1]
+        self.product_details = pd[product]
+        self.set_title_text(f"Select {self.product_details['product_name']} version")
+        self.set_title_logo(self.product_details["product_logo"])
+        local_repo_dir = self.product_details["repo_name"].split("/")[1]
         self.product_dir = fm.get_install_dir(local_repo_dir)
-        self.branch_name = pd[self.product]["default_branch"]
+        self.branch_name = self.product_details["default_branch"]
         self.setup_local_repo("setup_local_repo")
 
     def setup_version_frame(self):
@@ -166,6 +174,35 @@ class SelectVersionConfig(WindowLayout):
         self.version_radio_frame.grid(column=0, row=1, **grid_options)
         self.config_radio_frame.grid(column=0, row=2, **grid_options)
 
+    def reset_version_frame(self):
+        """
+        Function to reset the version and configuration selections to their initial state
+
+        Any Git process still running for the previous product is abandoned by replacing the queue, so its results
+        can't update this view for the new product
+        """
+        self.queue = Queue()
+        if self.process_running:
+            self.process_stop()
+        self.repo = None
+        self.version_list = None
+        self.latest_prod = None
+        self.latest_devel = None
+        self.selected_ref = None
+        self.select_version.set(0)
+        self.latest_prod_radio.configure(text="Latest Production - Recommended!")
+        self.latest_prod_radio.grid()
+        self.latest_devel_radio.configure(text="Latest Development")
+        self.latest_devel_radio.grid()
+        self.select_version_combo.configure(values=["Select a version"])
+        self.select_version_combo.set("Select a version")
+        self.config_option.set(0)
+        self.config_path.set("")
+        self.next_back.set_next_text("Configuration")
+        self.next_back.set_next_command(None)
+        self.next_back.disable_next()
+        self.next_back.hide_log_button()
+
     def setup_local_repo(self, event):
         """
         Function to setup the local repository
@@ -179,12 +216,13 @@ class SelectVersionConfig(WindowLayout):
             - delete any existing configuration files
             
         - if not, clone repo
+        - checkout the default branch and pull the latest updates
         - get list of versions, latest prod, and latest devel versions
         """
         if event == "setup_local_repo":
             self.log.debug("Setting up local repository")
             self.delete_config_files()
-            if os.path.exists(self.product_dir) and os.path.isdir(self.product_dir):
+            if os.path.isdir(self.product_dir):
                 if self.git.dir_is_git_repo(self.product_dir):
                     self.repo = self.git.get_repo(self.product_dir)
                     if self.repo:
@@ -207,21 +245,21 @@ class SelectVersionConfig(WindowLayout):
                 self.setup_local_repo("clone_repo")
         elif event == "clone_repo":
             self.process_start("clone_repo", "Clone repository", "Setup_Local_Repo")
-            self.git.clone_repo(pd[self.product]["repo_url"], self.product_dir, self.queue)
+            self.git.clone_repo(self.product_details["repo_url"], self.product_dir, self.queue)
         elif self.process_phase == "clone_repo" or event == "get_latest":
             if self.process_status == "success" or event == "get_latest":
                 self.repo = self.git.get_repo(self.product_dir)
                 branch_ref = self.git.get_branch_ref(self.repo, self.branch_name)
                 self.log.debug("Checkout %s", self.branch_name)
-                try:
-                    self.repo.checkout(refname=branch_ref)
-                except Exception as error:
-                    message = self.get_exception(error)
-                    self.process_error(message)
-                    self.log.error(message)
-                else:
-                    self.process_start("pull_latest", "Get latest software updates", "Setup_Local_Repo")
-                    self.git.pull_latest(self.repo, self.branch_name, self.queue)
+                self.process_start("checkout_branch", f"Checkout {self.branch_name} branch", "Setup_Local_Repo")
+                self.git.checkout_ref(self.repo, branch_ref, self.queue)
+            elif self.process_status == "error":
+                self.process_error(self.process_data)
+                self.log.error(self.process_data)
+        elif self.process_phase == "checkout_branch":
+            if self.process_status == "success":
+                self.process_start("pull_latest", "Get latest software updates", "Setup_Local_Repo")
+                self.git.pull_latest(self.repo, self.branch_name, self.queue)
             elif self.process_status == "error":
                 self.process_error(self.process_data)
                 self.log.error(self.process_data)
@@ -239,52 +277,70 @@ class SelectVersionConfig(WindowLayout):
         Function to obtain versions available in the repo
 
         Once versions obtained, set appropriately
+
+        The repo's version tags are only read once, and the latest versions are taken from that list
         """
-        self.latest_prod = self.git.get_latest_prod(self.repo)
+        self.version_list = self.git.get_repo_versions(self.repo)
+        self.latest_prod = self.git.get_latest_prod(self.repo, version_list=self.version_list)
         if self.latest_prod:
             self.latest_prod_radio.configure(text=f"Latest Production ({self.latest_prod[0]}) - Recommended!")
         else:
             self.latest_prod_radio.grid_remove()
             self.select_version.set(-1)
-        self.latest_devel = self.git.get_latest_devel(self.repo)
+        self.latest_devel = self.git.get_latest_devel(self.repo, version_list=self.version_list)
         if self.latest_devel:
             self.latest_devel_radio.configure(text=f"Latest Development ({self.latest_devel[0]})")
         else:
             self.latest_devel_radio.grid_remove()
-        self.version_list = self.git.get_repo_versions(self.repo)
         self.version_list.update({'v9.9.9-Devel devel branch':
                                   {'major': 9, 'minor': 9, 'patch': 9, 'type': 'Devel', 'ref': 'origin/devel'}})
         if self.version_list:
-            version_select = list(self.version_list.keys())
-            self.select_version_combo.configure(values=version_select)
+            self.select_version_combo.configure(values=tuple(self.version_list))
         self.set_version()
 
     def set_version(self):
         """
-        Function to checkout the selected version according to the radio buttons
+        Function to record the selected version according to the radio buttons
+
+        The selected version is only checked out when moving to the next view by checkout_version, rather than each
+        time a different version is chosen
         """
+        self.selected_ref = None
         if self.select_version.get() == 0 and self.latest_prod:
-            self.repo.checkout(refname=self.latest_prod[1])
-            self.log.debug("Latest prod selected: %s", self.latest_prod[1])
+            self.selected_ref = self.latest_prod[1]
+            self.log.debug("Latest prod selected: %s", self.selected_ref)
             self.set_next_config()
         elif self.select_version.get() == 1 and self.latest_devel:
-            self.repo.checkout(refname=self.latest_devel[1])
-            self.log.debug("Latest devel selected: %s", self.latest_devel[1])
+            self.selected_ref = self.latest_devel[1]
+            self.log.debug("Latest devel selected: %s", self.selected_ref)
             self.set_next_config()
         elif self.select_version.get() == 2:
             if self.select_version_combo.get() != "Select a version":
-                # self.repo.checkout(refname=self.version_list[self.select_version_combo.get()]["ref"])
-                rname = self.version_list[self.select_version_combo.get()]["ref"]
-                try:
-                    self.repo.checkout(refname=rname)
-                except Exception:
-                    _, ref = self. repo.resolve_refish(refish=rname)
-                    self.repo.checkout(refname=ref)
-                self.log.debug("Version selected: %s", self.version_list[self.select_version_combo.get()]["ref"])
+                self.selected_ref = self.version_list[self.select_version_combo.get()]["ref"]
+                self.log.debug("Version selected: %s", self.selected_ref)
                 self.set_next_config()
             else:
                 self.next_back.disable_next()
 
+    def checkout_version(self):
+        """
+        Function to checkout the selected version
+        """
+        if self.selected_ref is not None:
+            try:
+                self.repo.checkout(refname=self.selected_ref)
+            except Exception:
+                _, ref = self.repo.resolve_refish(refish=self.selected_ref)
+                self.repo.checkout(refname=ref)
+            self.log.debug("Checked out %s", self.selected_ref)
+
+    def configure_version(self, version):
+        """
+        Function to checkout the selected version and move on to configuring the product
+        """
+        self.checkout_version()
+        self.master.switch_view(self.product, None, version)
+
     def set_select_version(self, value):
         """
         Function to set select a specific version when setting via combobox
@@ -310,14 +366,11 @@ class SelectVersionConfig(WindowLayout):
                 if self.select_version_combo.get() != "Select a version":
                     set_version = self.select_version_combo.get()
                     self.next_back.enable_next()
-            if self.set_version:
-                self.next_back.set_next_command(lambda next_product=self.product,
-                                                set_version=set_version: self.master.switch_view(next_product,
-                                                                                                 None,
-                                                                                                 set_version))
+            if set_version:
+                self.next_back.set_next_command(lambda version=set_version: self.configure_version(version))
             else:
                 self.next_back.disable_next()
-            self.next_back.set_next_text(f"Configure {pd[self.product]['product_name']}")
+            self.next_back.set_next_text(f"Configure {self.product_details['product_name']}")
         elif self.config_option.get() == 1:
             self.master.use_existing = True
             self.next_back.set_next_command(self.copy_config_files)
@@ -351,18 +404,19 @@ class SelectVersionConfig(WindowLayout):
             if os.path.realpath(self.config_path.get()) == os.path.realpath(self.product_dir):
                 self.process_error("You cannot use EX-Installer's own generated files as these will be overwritten")
                 self.next_back.disable_next()
-                self.log.error(f"EX-Installer repository folder location chosen: {self.product_dir}")
+                self.log.error("EX-Installer repository folder location chosen: %s", self.product_dir)
             else:
-                config_files = fm.get_config_files(self.config_path.get(), pd[self.product]["minimum_config_files"])
-                if config_files:
+                minimum_config_files = self.product_details["minimum_config_files"]
+                missing_file = fm.find_missing_file(self.config_path.get(), minimum_config_files)
+                if missing_file is None:
                     self.next_back.enable_next()
                 else:
-                    file_names = ", ".join(pd[self.product]["minimum_config_files"])
+                    file_names = ", ".join(minimum_config_files)
                     self.process_error(("Selected configuration directory is missing the required files: " +
                                        f"{file_names}"))
                     self.next_back.disable_next()
-                    self.log.error("Config dir %s missing minimum config files %s", self.config_path.get(),
-                                   config_files)
+                    self.log.error("Config dir %s missing minimum config file %s", self.config_path.get(),
+                                   missing_file)
         else:
             self.next_back.disable_next()
 
@@ -371,15 +425,7 @@ class SelectVersionConfig(WindowLayout):
         Function to delete config files from product directory
         needed on subsequent passes thru the logic
         """
-        file_list = []
-        min_list = fm.get_config_files(self.product_dir, pd[self.product]["minimum_config_files"])
-        if min_list:
-            file_list += min_list
-        other_list = None
-        if "other_config_files" in pd[self.product]:
-            other_list = fm.get_config_files(self.product_dir, pd[self.product]["other_config_files"])
-        if other_list:
-            file_list += other_list
+        file_list = fm.get_config_files(self.product_dir, self.product_details["all_config_files"]) or []
         self.log.debug("Deleting files: %s", file_list)
         error_list = fm.delete_config_files(self.product_dir, file_list)
         if error_list:
@@ -392,14 +438,12 @@ class SelectVersionConfig(WindowLayout):
         Function to copy config files from selected directory to product directory
         also switches view to advanced_config if copy is successful
         """
-        copy_list = fm.get_config_files(self.config_path.get(), pd[self.product]["minimum_config_files"])
-        if copy_list:
-            extra_list = None
-            if "other_config_files" in pd[self.product]:
-                extra_list = fm.get_config_files(self.config_path.get(), pd[self.product]["other_config_files"])
-            if extra_list:
-                copy_list += extra_list
-            file_copy = fm.copy_config_files(self.config_path.get(), self.product_dir, copy_list)
+        self.checkout_version()
+        config_path = self.config_path.get()
+        # Find all config files in a single directory scan, then make sure the minimum files are among them
+        copy_list = fm.get_config_files(config_path, self.product_details["all_config_files"]) or []
+        if all(file in copy_list for file in self.product_details["minimum_config_files"]):
+            file_copy = fm.copy_config_files(config_path, self.product_dir, copy_list)
             if file_copy:
                 file_list = ", ".join(file_copy)
                 self.process_error(f"Failed to copy one or more files: {file_list}")
@@ -408,7 +452,7 @@ class SelectVersionConfig(WindowLayout):
                 self.master.switch_view("advanced_config", self.product)
         else:
             self.process_error("Selected configuration directory is missing the required files")
-            self.log.error("Directory %s is missing required files", self.config_path.get())
+            self.log.error("Directory %s is missing required files", config_path)
 
     def resolve_local_changes(self, changes):
         """
@@ -416,7 +460,7 @@ class SelectVersionConfig(WindowLayout):
 
         Resolution means perforing a git hard reset, cancel means exiting the app
         """
-        message = f"WARNING: The following changes have been detected in {pd[self.product]['product_name']}:\n"
+        message = f"WARNING: The following changes have been detected in {self.product_details['product_name']}:\n"
         for change in changes:
             message += change + "\n"
         message += ("\nYou can either override these changes or cancel and resolve these issues manually.\n\n"
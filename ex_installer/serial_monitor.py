@@ -26,7 +26,7 @@ along with CommandStation.  If not, see <https://www.gnu.org/licenses/>.
 # Import Python modules
 import customtkinter as ctk
 import logging
-from queue import Queue
+from collections import deque
 from threading import Thread
 import subprocess
 import platform
@@ -40,63 +40,85 @@ from datetime import datetime
 
 # Import local modules
 from . import images
-from .common_fonts import CommonFonts
 from .file_manager import FileManager as fm
 
 # Define valid monitor highlights
+# The prefilter is text that must be in a line for the regex to match, so most lines can skip the regex search
 monitor_highlights = {
     "Version": {
         "regex": r"^\<(iDCC-EX\sV-.*)\>$",
         "matches": 1,
-        "tag": "green"
+        "tag": "green",
+        "prefilter": "<iDCC-EX"
     },
     "WiFi AP Details (ESP32)": {
         "regex": r"^\<\*\sWifi\sAP\sSSID\s(.+?)\sPASS\s(.+?)\s\*\>$",
         "matches": 2,
-        "tag": "blue"
+        "tag": "blue",
+        "prefilter": "SSID"
     },
     "WiFi AP Details (ESP8266)": {
-        "regex": r"^AT\+CWSAP_CUR=\"(.+?)\",\"(.+?)\".*$",
+        "regex": r"^AT\+CWSAP_CUR=\"(.+?)\",\"(.+?)\"",
         "matches": 2,
-        "tag": "blue"
+        "tag": "blue",
+        "prefilter": "AT+CWSAP_CUR="
     },
     "WiFi AP IP": {
         "regex": r"<\*\sWifi\sAP\sIP\s(\d*\.\d*\.\d*\.\d*)\s\*\>",
         "matches": 1,
-        "tag": "purple"
+        "tag": "purple",
+        "prefilter": "Wifi"
     },
     "Port (ESP32)": {
+        # The leading .* is greedy so the last port in the line is highlighted
         "regex": r".*port\s(\d*)\s\*\>",
         "matches": 1,
-        "tag": "purple"
+        "tag": "purple",
+        "prefilter": "port"
     },
     "Port (ESP8266)": {
-        "regex": r"^AT\+CIPSERVER=\d*,(\d*).*$",
+        "regex": r"^AT\+CIPSERVER=\d*,(\d*)",
         "matches": 1,
-        "tag": "purple"
+        "tag": "purple",
+        "prefilter": "AT+CIPSERVER="
     },
     "WiFi Firmware": {
         "regex": r"^AT\sversion\:(.+?)$",
         "matches": 1,
-        "tag": "green"
+        "tag": "green",
+        "prefilter": "version:"
     },
     "WiFi ST Details": {
-        "regex": r"^AT\+CWJAP_CUR=\"(.+?)\",\"(.+?)\".*$",
+        "regex": r"^AT\+CWJAP_CUR=\"(.+?)\",\"(.+?)\"",
         "matches": 2,
-        "tag": "blue"
+        "tag": "blue",
+        "prefilter": "AT+CWJAP_CUR="
     },
     "WiFi ST IP": {
         "regex": r"\"(\d*\.\d*\.\d*\.\d*)\"",
         "matches": 1,
-        "tag": "purple"
+        "tag": "purple",
+        "prefilter": "\""
     }
 }
 
+# Compile the highlight regular expressions once as they're matched against every line of device output
+# Device output is plain ASCII, so ASCII matching avoids the Unicode lookups for \d and \s
+# Each highlight is unpacked to (prefilter, pattern, matches, tag) so matching doesn't need dictionary lookups
+highlight_patterns = tuple(
+    (highlight["prefilter"], re.compile(highlight["regex"], re.ASCII), highlight["matches"], highlight["tag"])
+    for highlight in monitor_highlights.values()
+)
+
 
 class SerialMonitor(ctk.CTkToplevel):
     """
     Class to define a window for the serial monitor
     """
+
+    # Maximum lines to keep in the output textbox, the full output is kept in the log buffer for saving
+    max_lines = 5000
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
@@ -105,8 +127,8 @@ class SerialMonitor(ctk.CTkToplevel):
         self.log.debug("Open window")
         self.report_callback_exception = self.exception_handler
 
-        # Set up fonts
-        self.common_fonts = CommonFonts(self)
+        # Use the main window's fonts rather than creating the same fonts again each time the monitor opens
+        self.common_fonts = self.master.winfo_toplevel().common_fonts
 
         # Set up event handlers
         event_callbacks = {
@@ -132,8 +154,7 @@ class SerialMonitor(ctk.CTkToplevel):
         # Get existing Arduino CLI instance
         self.acli = self.master.winfo_toplevel().acli
 
-        # Create queue and variables for process monitoring
-        self.queue = Queue()
+        # Create variables for process monitoring
         self.process_phase = None
         self.process_status = None
         self.process_topic = None
@@ -169,12 +190,14 @@ class SerialMonitor(ctk.CTkToplevel):
         self.device_frame.grid(column=0, row=3, sticky="nsew", padx=5, pady=(0, 5))
 
         # Create command frame widgets and layout frame
-        self.command_history = []
+        # Command history is capped, with a set to check for commands already in it
+        self.command_history = deque(maxlen=100)
+        self.command_history_set = set()
         grid_options = {"padx": 5, "pady": 5}
         self.command_label = ctk.CTkLabel(self.command_frame, text="Enter command:", font=self.instruction_font)
         self.command = ctk.StringVar(self)
-        self.command_entry = ctk.CTkComboBox(self.command_frame, variable=self.command, values=self.command_history,
-                                             command=self.send_command)
+        self.command_entry = ctk.CTkComboBox(self.command_frame, variable=self.command,
+                                             values=list(self.command_history), command=self.send_command)
         self.command_entry.bind("<Return>", self.send_command)
         self.command_button = ctk.CTkButton(self.command_frame, text="Send", font=self.button_font, width=80,
                                             command=self.send_command)
@@ -219,6 +242,17 @@ class SerialMonitor(ctk.CTkToplevel):
         self.device_label = ctk.CTkLabel(self.device_frame, text=None, font=self.instruction_font)
         self.device_label.grid(column=0, row=0, sticky="ew", padx=5, pady=5)
 
+        # Serial reader and output buffer state, the textbox itself is limited to max_lines
+        # Thread reading the serial port, only set while monitoring
+        self.read_thread = None
+        # Lines of device output from the read thread, deque appends and pops are thread safe without a lock
+        self.output_lines = deque()
+        # Keep the text added to the textbox so the device log can be saved without reading it back from the widget
+        # All output is kept for the life of the window, including lines trimmed from the textbox
+        self.log_buffer = []
+        # Scheduled call to add queued device output to the textbox, only set while monitoring
+        self.output_after_id = None
+
         # Start serial monitor process
         self.monitor()
 
@@ -226,16 +260,19 @@ class SerialMonitor(ctk.CTkToplevel):
         """
         Close the monitor window nicely:
 
+        - If thread running, join/end it, it exits within the serial timeout once close is clicked
         - If serial port open, close it
-        - If thread running, join/end it
         - Destroy this object
         """
         self.close_clicked = True
+        if self.output_after_id is not None:
+            self.after_cancel(self.output_after_id)
+            self.output_after_id = None
         if hasattr(self, "serial_port") and self.serial_port:
+            if self.read_thread is not None:
+                self.read_thread.join(timeout=1.0)
             if self.serial_port is not None:
                 self.serial_port.close()
-            if self.read_thread is not None:
-                self.read_thread.join()
         self.destroy()
 
     def monitor(self, event=None):
@@ -243,22 +280,26 @@ class SerialMonitor(ctk.CTkToplevel):
         Function to monitoring using PySerial
 
         Starts the process, and then creates a thread to read the output continuously
+
+        If already monitoring, the existing serial connection and thread are left running
         """
+        if self.read_thread is not None and self.read_thread.is_alive():
+            return
         self.command_entry.configure(state="disabled")
         self.command_button.configure(state="disabled")
         self.close_clicked = False
         if self.acli.selected_device is not None:
-            port = self.acli.detected_devices[self.acli.selected_device]['port']
-            text = ("Monitoring " +
-                    f"{self.acli.detected_devices[self.acli.selected_device]['matching_boards'][0]['name']} " +
-                    f" on {port}")
+            device = self.acli.detected_devices[self.acli.selected_device]
+            port = device.port
+            text = f"Monitoring {device.matching_boards[0].name}  on {port}"
             self.device_label.configure(text=text)
             try:
-                self.serial_port = serial.Serial(port, 115200)
+                self.serial_port = serial.Serial(port, 115200, timeout=0.1, write_timeout=1.0)
             except serial.SerialException as e:
                 self.log.error(f"Failed to open serial connection: {e}")
                 self.output_textbox.configure(state="normal")
                 self.output_textbox.insert("insert", f"Failed to open serial connection: {e}")
+                self.log_buffer.append(f"Failed to open serial connection: {e}\n")
                 self.output_textbox.configure(state="disabled")
                 return
 
@@ -267,47 +308,95 @@ class SerialMonitor(ctk.CTkToplevel):
             self.read_thread = Thread(target=self.read_output)
             self.read_thread.daemon = True
             self.read_thread.start()
+            if self.output_after_id is None:
+                self.output_after_id = self.after(50, self.process_output)
 
     def read_output(self):
         """
         Function to read serial output
+
+        This runs in a separate thread, so lines are added to output_lines for the GUI to process rather than updating
+        the textbox directly
         """
-        while True:
+        buffer = bytearray()
+        while not self.close_clicked:
             try:
-                if self.serial_port.in_waiting > 0:
-                    output = self.serial_port.readline()
-                    """
-                    if closing the window, the serial port was closed and it may have garbage, ignore it
-                    """
-                    if self.close_clicked:
-                        return
-                    output = output.decode().strip()
-                    self.update_textbox(output)
+                # Read whatever has arrived in one go, blocking for up to the port timeout if nothing has
+                data = self.serial_port.read(min(self.serial_port.in_waiting, 4096) or 1)
+                """
+                if closing the window, the serial port was closed and it may have garbage, ignore it
+                """
+                if self.close_clicked:
+                    return
+                if not data:
+                    continue
+                buffer.extend(data)
+                # Queue each complete line, any partial line is held in the buffer until the rest arrives
+                end = buffer.rfind(b"\n")
+                if end < 0:
+                    continue
+                # Decode all complete lines at once, splitting at a newline can't break a UTF-8 sequence
+                self.output_lines.extend(line.strip() for line in buffer[:end].decode("utf-8", "replace").split("\n"))
+                del buffer[:end + 1]
             except OSError as e:
                 if not self.close_clicked:
                     self.log.error(f"Error accessing serial port: {e}")
                 break
 
-    def update_textbox(self, output):
+    def process_output(self):
         """
-        Function to update the textbox with output from the Arduino CLI in monitor mode
+        Function to add device output queued by the read thread to the textbox
+
+        Runs on the GUI thread every 50ms while monitoring, adding up to 200 lines each time
         """
-        self.output_textbox.configure(state="normal")
-        for highlight in monitor_highlights.keys():
-            regex = monitor_highlights[highlight]["regex"]
-            matches = monitor_highlights[highlight]["matches"]
-            tag = monitor_highlights[highlight]["tag"]
-            match = re.search(regex, output)
-            if match and len(match.groups()) == matches:
-                for group in match.groups():
-                    temp = output.split(group)
-                    self.output_textbox.insert("insert", temp[0])
-                    self.output_textbox.insert("insert", group, tag)
-                    output = temp[1]
-        self.output_textbox.insert("insert", output + "\n")
-        self.output_textbox.see("end")
-        self.output_textbox.update_idletasks()
-        self.output_textbox.configure(state="disabled")
+        output_lines = self.output_lines
+        lines = [output_lines.popleft() for _ in range(min(len(output_lines), 200))]
+        if lines:
+            # Only scroll to the end if already there, so scrolling back through earlier output isn't interrupted
+            at_end = self.output_textbox.yview()[1] >= 0.999
+            self.output_textbox.configure(state="normal")
+            self.update_textbox(lines)
+            line_count = int(self.output_textbox.index("end-1c").split(".")[0])
+            if line_count > self.max_lines:
+                self.output_textbox.delete("1.0", f"{line_count - self.max_lines}.0")
+            if at_end:
+                self.output_textbox.see("end")
+            self.output_textbox.configure(state="disabled")
+        self.output_after_id = self.after(50, self.process_output)
+
+    def update_textbox(self, lines):
+        """
+        Function to update the textbox with a batch of lines of device output
+
+        The textbox must already be in the normal state, process_output() handles this for each batch of lines
+        """
+        # Collect the tagged ranges first, offset from the start of the batch
+        # For each line, each highlight only searches the text after the previous one's groups
+        tag_ranges = []
+        line_offset = 0
+        for output in lines:
+            position = 0
+            for prefilter, pattern, matches, tag in highlight_patterns:
+                remaining = output[position:]
+                if prefilter not in remaining:
+                    continue
+                match = pattern.search(remaining)
+                if match and len(match.groups()) == matches:
+                    offset = position
+                    for group in range(1, matches + 1):
+                        start, end = match.span(group)
+                        if start < 0:
+                            continue
+                        tag_ranges.append((tag, line_offset + offset + start, line_offset + offset + end))
+                        position = offset + end
+            line_offset += len(output) + 1
+        # Insert the whole batch at once, then tag the highlighted ranges relative to where it started
+        text = "\n".join(lines) + "\n"
+        self.log_buffer.extend(line + "\n" for line in lines)
+        batch_start = self.output_textbox.index("insert")
+        self.output_textbox.insert("insert", text)
+        for tag, start, end in tag_ranges:
+            self.output_textbox.tag_add(tag, f"{batch_start}+{start}c", f"{batch_start}+{end}c")
 
     def send_command(self, event=None):
         """
@@ -315,13 +404,20 @@ class SerialMonitor(ctk.CTkToplevel):
         """
         command_text = self.command_entry.get()
         if command_text != "":
-            self.serial_port.write((command_text + "\n").encode())
-            if command_text not in self.command_history:
+            try:
+                self.serial_port.write((command_text + "\n").encode())
+            except serial.SerialTimeoutException as e:
+                self.log.error("Timed out sending command to serial port: %s", e)
+            if command_text not in self.command_history_set:
+                if len(self.command_history) == self.command_history.maxlen:
+                    self.command_history_set.discard(self.command_history[0])
                 self.command_history.append(command_text)
-            self.command_entry.configure(values=self.command_history)
+                self.command_history_set.add(command_text)
+                self.command_entry.configure(values=list(self.command_history))
             self.command_entry.set("")
         self.output_textbox.configure(state="normal")
         self.output_textbox.insert("insert", command_text + "\n")
+        self.log_buffer.append(command_text + "\n")
         self.output_textbox.configure(state="disabled")
         self.output_textbox.see("end")
 
@@ -393,15 +489,16 @@ class SerialMonitor(ctk.CTkToplevel):
     def save_log_file(self):
         """
         Function to save the device log file to the chosen location, and open it
+
+        The log contains all device output since the monitor window was opened, including any lines that have been
+        trimmed from the textbox
         """
         if fm.is_valid_dir(self.log_path.get()):
             log_name = datetime.now().strftime("device-logs-%Y%m%d-%H%M%S.log")
             log_file = os.path.join(self.log_path.get(), log_name)
-            file_contents = self.output_textbox.get("1.0", ctk.END)
             try:
                 with open(log_file, "w", encoding="utf-8") as f:
-                    f.writelines(file_contents)
-                f.close()
+                    f.writelines(self.log_buffer)
             except Exception as error:
                 message = "Unable to save device log"
                 self.status_text.configure(text=message, text_color="red")
@@ -34,6 +34,30 @@ class Welcome(WindowLayout):
     """
     Class for the Welcome view
     """
+
+    # Welcome text, defined once for the class rather than built each time the view is created
+    intro_text = (
+        "EX-Installer simplifies the process of setting up the various software products "
+        "created by the DCC-EX team.\n\n"
+        "As our products provide for a large number of different configurations and allow a number of optional "
+        "features, we need to ask you some questions about what hardware you have and what options you want "
+        "to enable.\n\n"
+        "Steps:\n\n"
+    )
+    steps = (
+        "We first need to install the Arduino Command Line Interface (CLI).\n",
+        "You then need to select the type of Arduino you wish to install on.\n",
+        "Next you will select which of our products you wish to install.\n",
+        "From here you can choose some of the options for the software and apply additional configuration.\n",
+        "Finally, you will load the software on to your Arduino.\n\n"
+    )
+    outro_text = (
+        "The following pages you lead you through this process.\n\n"
+        "To continue, click the 'Manage Arduino CLI' button below and follow the instructions on each page.\n\n"
+        "(The button on the lower right on each page will move you to the next step. The button on the lower "
+        "left of each page will allow you to go back and change your selections.)\n\n"
+    )
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
@@ -46,11 +70,8 @@ class Welcome(WindowLayout):
         self.set_title_text("Welcome to EX-Installer")
 
         # Set up next/back buttons
-        self.next_back.hide_back()
-        self.next_back.set_next_text("Manage Arduino CLI")
-        self.next_back.set_next_command(lambda view="manage_arduino_cli": parent.switch_view(view))
+        self.configure_next_back(next_text="Manage Arduino CLI", next_view="manage_arduino_cli")
         self.next_back.hide_log_button()
-        self.next_back.hide_monitor_button()
 
         # Create and configure welcome container
         self.welcome_frame = ctk.CTkFrame(self.main_frame, height=360)
@@ -72,30 +93,10 @@ class Welcome(WindowLayout):
         self.set_text()
 
     def set_text(self):
-        self.welcome_textbox.insert(
-            "insert",
-            "EX-Installer simplifies the process of setting up the various software products " +
-            "created by the DCC-EX team.\n\n" +
-            "As our products provide for a large number of different configurations and allow a number of optional " +
-            "features, we need to ask you some questions about what hardware you have and what options you want " +
-            "to enable.\n\n" +
-            "Steps:\n\n"
-        )
-        bullet_list = [
-            "We first need to install the Arduino Command Line Interface (CLI).\n",
-            "You then need to select the type of Arduino you wish to install on.\n",
-            "Next you will select which of our products you wish to install.\n",
-            "From here you can choose some of the options for the software and apply additional configuration.\n",
-            "Finally, you will load the software on to your Arduino.\n\n"
-        ]
-        for item in bullet_list:
-            self.welcome_textbox.insert_bullet("insert", item)
-
-        self.welcome_textbox.insert(
-            "insert",
-            "The following pages you lead you through this process.\n\n" +
-            "To continue, click the 'Manage Arduino CLI' button below and follow the instructions on each page.\n\n" +
-            "(The button on the lower right on each page will move you to the next step. The button on the lower " +
-            "left of each page will allow you to go back and change your selections.)\n\n"
-        )
+        """
+        Function to add the welcome text to the textbox
+        """
+        self.welcome_textbox.insert("insert", self.intro_text)
+        self.welcome_textbox.insert_bullets("insert", self.steps)
+        self.welcome_textbox.insert("insert", self.outro_text)
         self.welcome_textbox.configure(state="disabled")